@@ -3,6 +3,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import re
+import hashlib
+import tempfile
 import matplotlib.ticker as mtick
 
 # ==========================================
@@ -11,6 +14,21 @@ import matplotlib.ticker as mtick
 TRADER_DATA_PATH = 'data/historical_data.csv'
 SENTIMENT_DATA_PATH = 'data/fear_greed_index.csv'
 
+# Max points drawn in the leverage scatter (a random sample looks the same as millions of rows)
+SCATTER_SAMPLE_SIZE = 50_000
+
+# Row count above which per-zone aggregation uses the optional Numba kernel; below it, importing
+# numba and loading the compiled kernel costs more than the np.bincount path takes
+NUMBA_MIN_ROWS = 5_000_000
+
+# PNG resolution; 150 dpi is plenty on screen, set PLOT_DPI=300 for print-quality images
+SAVE_DPI = int(os.environ.get('PLOT_DPI', 150))
+
+# Cleaned trader/sentiment frames are cached here as parquet, keyed by the input files.
+# Bump CACHE_VERSION whenever the loading/cleaning logic changes so stale frames are not reused.
+CACHE_DIR = 'cache'
+CACHE_VERSION = 2
+
 # ==========================================
 # VISUALIZATION STYLING (PROFESSIONAL UPGRADE)
 # ==========================================
@@ -25,43 +43,137 @@ sentiment_palette = {
     'Extreme Greed': '#1f77b4' # Blue
 }
 
-def add_bar_labels(ax, fmt='{:.2f}'):
-    """Adds bold data labels to bars with smart positioning."""
-    for p in ax.patches:
-        height = p.get_height()
-        # If bar is positive, label above. If negative, label below.
-        xy_pos = (0, 8) if height >= 0 else (0, -20)
-        
-        ax.annotate(fmt.format(height),
-                    (p.get_x() + p.get_width() / 2., height),
-                    ha='center', va='center',
-                    xytext=xy_pos,
-                    textcoords='offset points',
-                    fontsize=11, color='black', fontweight='bold')
+# Sentiment zones in display order, with the Fear & Greed Index cut-offs
+SENTIMENT_ORDER = ['Extreme Fear', 'Fear', 'Greed', 'Extreme Greed']
+SENTIMENT_BINS = [-np.inf, 25, 50, 75, np.inf]
+
+def read_trader_csv(path):
+    """Reads only the trader columns used downstream: timestamps, PnL and leverage."""
+    header = pd.read_csv(path, nrows=0).columns
+    relevant = [c for c in header
+                if c.lower().strip() in ('timestamp', 'timestamp ist')
+                or 'pnl' in c.lower() or 'leverage' in c.lower()]
+    try:
+        # Multithreaded parser; result stays NumPy-backed for the bincount aggregation
+        return pd.read_csv(path, usecols=relevant, engine='pyarrow')
+    except ImportError:
+        return pd.read_csv(path, usecols=relevant, engine='c')
+
+# Day-first layouts that can go through the fast fixed-format parser
+DAYFIRST_FORMATS = [
+    (r'\d{2}-\d{2}-\d{4} \d{2}:\d{2}', '%d-%m-%Y %H:%M'),
+    (r'\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2}', '%d-%m-%Y %H:%M:%S'),
+    (r'\d{2}/\d{2}/\d{4} \d{2}:\d{2}', '%d/%m/%Y %H:%M'),
+    (r'\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}', '%d/%m/%Y %H:%M:%S'),
+]
+
+def parse_dayfirst_datetimes(series):
+    """Parses day-first date strings, using an explicit format when the first value matches one."""
+    non_null = series.dropna()
+    sample = str(non_null.iloc[0]).strip() if len(non_null) else ''
+    fmt = next((f for pattern, f in DAYFIRST_FORMATS if re.fullmatch(pattern, sample)), None)
+    if fmt is None:
+        return pd.to_datetime(series, dayfirst=True, format='mixed', errors='coerce', cache=True)
+
+    parsed = pd.to_datetime(series, format=fmt, errors='coerce', cache=True)
+    # Rows in a different layout fall back to the slow mixed parser
+    misses = parsed.isna() & series.notna()
+    if misses.any():
+        parsed[misses] = pd.to_datetime(series[misses], dayfirst=True, format='mixed', errors='coerce')
+    return parsed
+
+def save_figure(fig, path):
+    """Lays out, saves and closes a single-plot figure."""
+    fig.tight_layout()
+    fig.savefig(path, dpi=SAVE_DPI)
+    plt.close(fig)
+    print(f"-> Saved professional {path}")
 
 # ==========================================
 # 1. LOAD AND CLEAN (EXACT WORKING LOGIC)
 # ==========================================
-def load_and_clean_data():
-    print("--- 1. LOADING & DIAGNOSING DATA ---")
-    
-    # 1. Load Trader Data
-    if os.path.exists(TRADER_DATA_PATH):
-        trader_df = pd.read_csv(TRADER_DATA_PATH)
-    elif os.path.exists('historical_data.csv'):
-        trader_df = pd.read_csv('historical_data.csv')
-    else:
-        print(f"CRITICAL ERROR: Could not find trader data.")
-        return None, None
+def to_day_key(series):
+    """Truncates datetimes to their (local) calendar day."""
+    if series.dt.tz is None:
+        # Casting the raw datetime64 values to day resolution truncates in one pass
+        return series.to_numpy().astype('datetime64[D]')
+    # tz-aware values would be cast in UTC and could land on the previous/next day
+    return series.dt.normalize()
 
-    # 2. Load Sentiment Data
-    if os.path.exists(SENTIMENT_DATA_PATH):
-        sentiment_df = pd.read_csv(SENTIMENT_DATA_PATH)
-    elif os.path.exists('fear_greed_index.csv'):
-        sentiment_df = pd.read_csv('fear_greed_index.csv')
-    else:
-        print(f"CRITICAL ERROR: Could not find sentiment data.")
-        return None, None
+def _find(paths):
+    """Returns the first of the candidate paths that is an existing file, or None."""
+    return next((p for p in paths if os.path.isfile(p)), None)
+
+def map_columns(trader_cols, sentiment_cols):
+    """Resolves the (normalized) PnL, leverage and sentiment value column names, or None for each."""
+    # Substring matches ('closed pnl', 'closed_pnl', ...), so one pass resolves both trader columns
+    pnl_col = lev_col = None
+    for c in trader_cols:
+        if pnl_col is None and 'pnl' in c:
+            pnl_col = c
+        if lev_col is None and 'leverage' in c:
+            lev_col = c
+    val_col = next((c for c in sentiment_cols if 'value' in c and 'size' not in c), None)
+    return pnl_col, lev_col, val_col
+
+def cleaned_cache_paths(trader_path, sentiment_path):
+    """Returns the parquet cache paths for the cleaned frames of these exact input files."""
+    sig = [CACHE_VERSION] + [(p, os.path.getmtime(p), os.path.getsize(p)) for p in (trader_path, sentiment_path)]
+    key = hashlib.md5(repr(sig).encode()).hexdigest()[:12]
+    return (os.path.join(CACHE_DIR, f'trader_{key}.parquet'),
+            os.path.join(CACHE_DIR, f'sentiment_{key}.parquet'))
+
+def read_cached_frames(cache_paths):
+    """Returns the cached frames, or None on a miss. Unreadable cache files are deleted."""
+    if not all(os.path.isfile(p) for p in cache_paths):
+        return None
+    try:
+        return [pd.read_parquet(p) for p in cache_paths]
+    except ImportError:
+        return None
+    except Exception:
+        # Truncated or corrupt file (e.g. an interrupted older run): drop it and rebuild
+        print("-> Cached data is unreadable. Rebuilding it...")
+        for p in cache_paths:
+            try:
+                os.remove(p)
+            except OSError:
+                pass
+        return None
+
+def write_cached_frames(frames, cache_paths):
+    """Best-effort cache write; each file appears atomically and caches for other inputs are pruned."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for df, path in zip(frames, cache_paths):
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=os.path.basename(path) + '.', suffix='.tmp')
+            os.close(fd)
+            try:
+                df.to_parquet(tmp_path, compression='zstd')
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    except ImportError:
+        print("-> No parquet engine installed. Skipping the cleaned-data cache.")
+        return
+    except Exception as e:
+        print(f"-> Could not write the cleaned-data cache ({e}). Continuing without it.")
+        return
+
+    # Only the current inputs' cache is kept (older keys and leftover temp files are removed)
+    keep = {os.path.basename(p) for p in cache_paths}
+    for name in os.listdir(CACHE_DIR):
+        if name.startswith(('trader_', 'sentiment_')) and name not in keep:
+            try:
+                os.remove(os.path.join(CACHE_DIR, name))
+            except OSError:
+                pass
+
+def clean_data(trader_path, sentiment_path):
+    """Reads both CSVs and derives the shared day-level 'date_key' column."""
+    trader_df = read_trader_csv(trader_path)
+    sentiment_df = pd.read_csv(sentiment_path)
 
     # Normalize Columns
     trader_df.columns = [c.lower().strip() for c in trader_df.columns]
@@ -75,7 +187,7 @@ def load_and_clean_data():
         trader_df['datetime'] = pd.to_datetime(trader_df['timestamp'], unit='ms')
     elif 'timestamp ist' in trader_df.columns:
         print("-> Using string 'timestamp ist' column for Trader Data...")
-        trader_df['datetime'] = pd.to_datetime(trader_df['timestamp ist'], dayfirst=True, format='mixed', errors='coerce')
+        trader_df['datetime'] = parse_dayfirst_datetimes(trader_df['timestamp ist'])
     else:
         print("ERROR: Could not find a recognizable time column in Trader Data.")
         return None, None
@@ -92,13 +204,47 @@ def load_and_clean_data():
          return None, None
 
     # --- NORMALIZE TO JUST DATE ---
-    trader_df['date_key'] = trader_df['datetime'].dt.normalize()
-    sentiment_df['date_key'] = sentiment_df['date_key_raw'].dt.normalize()
+    trader_df['date_key'] = to_day_key(trader_df['datetime'])
+    sentiment_df['date_key'] = to_day_key(sentiment_df['date_key_raw'])
 
     # Drop NaTs
     trader_df = trader_df.dropna(subset=['date_key'])
     sentiment_df = sentiment_df.dropna(subset=['date_key'])
 
+    return trader_df, sentiment_df
+
+def load_and_clean_data():
+    print("--- 1. LOADING & DIAGNOSING DATA ---")
+    
+    # 1. Locate Trader Data
+    trader_path = _find([TRADER_DATA_PATH, 'historical_data.csv'])
+    if trader_path is None:
+        print(f"CRITICAL ERROR: Could not find trader data.")
+        return None, None
+
+    # 2. Locate Sentiment Data
+    sentiment_path = _find([SENTIMENT_DATA_PATH, 'fear_greed_index.csv'])
+    if sentiment_path is None:
+        print(f"CRITICAL ERROR: Could not find sentiment data.")
+        return None, None
+
+    # 3. Reuse the cleaned frames from a previous run if the inputs are unchanged
+    cache_paths = cleaned_cache_paths(trader_path, sentiment_path)
+    cached = read_cached_frames(cache_paths)
+    if cached is not None:
+        trader_df, sentiment_df = cached
+        print(f"-> Loaded cleaned data from cache ({CACHE_DIR}/)...")
+    else:
+        trader_df, sentiment_df = clean_data(trader_path, sentiment_path)
+        if trader_df is None:
+            return None, None
+
+        # Keep only the join key and the columns the analysis maps
+        pnl_col, lev_col, val_col = map_columns(trader_df.columns, sentiment_df.columns)
+        trader_df = trader_df[['date_key'] + [c for c in (pnl_col, lev_col) if c]]
+        sentiment_df = sentiment_df[['date_key'] + ([val_col] if val_col else [])]
+        write_cached_frames((trader_df, sentiment_df), cache_paths)
+
     # --- DIAGNOSTIC PRINT ---
     t_min, t_max = trader_df['date_key'].min(), trader_df['date_key'].max()
     s_min, s_max = sentiment_df['date_key'].min(), sentiment_df['date_key'].max()
@@ -111,52 +257,122 @@ def load_and_clean_data():
         
     return trader_df, sentiment_df
 
+# ==========================================
+# PER-ZONE AGGREGATION
+# ==========================================
+_zone_stats_numba = None
+
+def _load_zone_stats_numba():
+    """Returns the fused Numba kernel, compiling (or loading it from cache) on first use; None without numba."""
+    global _zone_stats_numba
+    if _zone_stats_numba is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            return None
+
+        @njit(parallel=True, cache=True)
+        def kernel(codes, pnl, n_zones, n_chunks):
+            # Each chunk accumulates into its own row, so the parallel loop never races
+            partial = np.zeros((n_chunks, 4, n_zones))
+            step = (codes.size + n_chunks - 1) // n_chunks
+            for c in prange(n_chunks):
+                for i in range(c * step, min((c + 1) * step, codes.size)):
+                    z = codes[i]
+                    if z < 0:
+                        continue
+                    p = pnl[i]
+                    partial[c, 0, z] += 1
+                    if p > 0:
+                        partial[c, 1, z] += 1
+                    if not np.isnan(p):
+                        partial[c, 2, z] += p
+                        partial[c, 3, z] += 1
+            return partial.sum(axis=0)
+
+        _zone_stats_numba = kernel
+    return _zone_stats_numba
+
+def zone_stats(codes, pnl_arr, n_zones):
+    """Returns per-zone trade counts, win counts, PnL sums and non-missing PnL counts."""
+    if codes.size > NUMBA_MIN_ROWS:
+        kernel = _load_zone_stats_numba()
+        if kernel is not None:
+            from numba import get_num_threads
+            return kernel(codes, pnl_arr, n_zones, get_num_threads())
+
+    in_zone = codes >= 0
+    codes, pnl_arr = codes[in_zone], pnl_arr[in_zone]
+    has_pnl = ~np.isnan(pnl_arr)
+    return np.stack([
+        np.bincount(codes, minlength=n_zones),
+        np.bincount(codes, weights=pnl_arr > 0, minlength=n_zones),
+        np.bincount(codes[has_pnl], weights=pnl_arr[has_pnl], minlength=n_zones),
+        np.bincount(codes[has_pnl], minlength=n_zones),
+    ])
+
 # ==========================================
 # 2. ANALYZE & VISUALIZE (UPGRADED PLOTS)
 # ==========================================
 def analyze_and_visualize(trader_df, sentiment_df):
     print("\n--- 2. MERGING & MAPPING ---")
     
-    # Merge
-    merged_df = pd.merge(trader_df, sentiment_df, on='date_key', how='inner')
+    # --- INTELLIGENT COLUMN MAPPING (resolved on each source, before the merge) ---
+    pnl_col, lev_col, val_col = map_columns(trader_df.columns, sentiment_df.columns)
+
+    # Merge: look up each trade's day in a small date-indexed sentiment table,
+    # carrying only the mapped columns into the merged frame
+    trader_cols = ['date_key'] + [c for c in (pnl_col, lev_col) if c]
+    sent_lookup = sentiment_df.set_index('date_key')[[val_col] if val_col else []].sort_index()
+    merged_df = trader_df[trader_cols].join(sent_lookup, on='date_key', how='inner')
     print(f"Merged Rows: {merged_df.shape[0]}")
     
     if merged_df.empty:
         print("ERROR: Merged DataFrame is still empty.")
         return
 
-    # --- INTELLIGENT COLUMN MAPPING ---
-    
-    # 1. PnL Mapping
-    pnl_col = next((c for c in merged_df.columns if 'closed pnl' in c or 'closed_pnl' in c or 'pnl' in c), None)
+    # 1. PnL Mapping (PnL and leverage are kept as float32: only means, sign tests and a scatter use them)
     if pnl_col:
-        if merged_df[pnl_col].dtype == object:
-             merged_df['pnl_clean'] = pd.to_numeric(merged_df[pnl_col].astype(str).str.replace(',', '').str.replace('$', ''), errors='coerce')
+        if pd.api.types.is_numeric_dtype(merged_df[pnl_col]):
+             merged_df['pnl_clean'] = merged_df[pnl_col].astype(np.float32)
         else:
-             merged_df['pnl_clean'] = merged_df[pnl_col]
+             merged_df['pnl_clean'] = pd.to_numeric(merged_df[pnl_col].astype(str).str.replace(r'[,$]', '', regex=True), errors='coerce').astype(np.float32)
     else:
         print("WARNING: PnL column not found.")
 
     # 2. Leverage Mapping
-    lev_col = next((c for c in merged_df.columns if 'leverage' in c), None)
     if lev_col:
-        merged_df['lev_clean'] = pd.to_numeric(merged_df[lev_col], errors='coerce')
+        merged_df['lev_clean'] = pd.to_numeric(merged_df[lev_col], errors='coerce').astype(np.float32)
     else:
         merged_df['lev_clean'] = None
 
     # 3. Sentiment Value Mapping
-    val_col = next((c for c in merged_df.columns if 'value' in c and 'size' not in c), None)
     if val_col:
         merged_df['sentiment_value'] = merged_df[val_col]
-        def get_bucket(val):
-            try:
-                v = float(val)
-                if v < 25: return 'Extreme Fear'
-                elif v < 50: return 'Fear'
-                elif v < 75: return 'Greed'
-                else: return 'Extreme Greed'
-            except: return 'Unknown'
-        merged_df['sentiment_bucket'] = merged_df['sentiment_value'].apply(get_bucket)
+        # Vectorized bucketing (left-closed bins: 25 -> Fear, 50 -> Greed, 75 -> Extreme Greed).
+        # Kept as an ordered categorical so groupby works on integer codes; unparseable values stay NaN.
+        sv = pd.to_numeric(merged_df['sentiment_value'], errors='coerce')
+        merged_df['sentiment_bucket'] = pd.cut(sv, bins=SENTIMENT_BINS, labels=SENTIMENT_ORDER, right=False)
+
+    # Keep only the cleaned columns the aggregation and plots read; the raw source columns are dropped
+    merged_df = merged_df[[c for c in ('sentiment_bucket', 'pnl_clean', 'lev_clean', 'sentiment_value')
+                           if c in merged_df.columns]].copy()
+
+    # 4. Per-Zone Aggregation (one bincount per statistic, or a fused Numba loop on very large inputs)
+    agg_df = None
+    if 'pnl_clean' in merged_df.columns and 'sentiment_bucket' in merged_df.columns:
+        # float32 halves the bytes scanned; both paths still accumulate in float64
+        pnl_arr = merged_df['pnl_clean'].to_numpy(dtype=np.float32, na_value=np.nan)
+
+        # Category codes index SENTIMENT_ORDER directly; -1 marks values outside every zone
+        codes = merged_df['sentiment_bucket'].cat.codes.to_numpy()
+        trades, wins, pnl_sums, pnl_counts = zone_stats(codes, pnl_arr, len(SENTIMENT_ORDER))
+
+        # Mean PnL skips missing PnL; win rate counts them as non-wins. Empty zones are dropped.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            agg_df = pd.DataFrame({'mean_pnl': pnl_sums / pnl_counts, 'win_rate': wins / trades},
+                                  index=SENTIMENT_ORDER)
+        agg_df = agg_df[trades > 0]
 
     # ==========================================
     # --- 3. GENERATING PLOTS (PROFESSIONAL) ---
@@ -166,77 +382,71 @@ def analyze_and_visualize(trader_df, sentiment_df):
         os.makedirs('images')
 
     # --- Plot 1: PnL by Sentiment ---
-    if 'pnl_clean' in merged_df.columns and 'sentiment_bucket' in merged_df.columns:
-        perf = merged_df.groupby('sentiment_bucket')['pnl_clean'].mean()
-        order = ['Extreme Fear', 'Fear', 'Greed', 'Extreme Greed']
-        perf = perf.reindex([x for x in order if x in perf.index])
+    if agg_df is not None:
+        perf = agg_df['mean_pnl']
         
-        plt.figure(figsize=(12, 8))
-        ax = sns.barplot(x=perf.index, y=perf.values, palette=sentiment_palette)
+        fig, ax = plt.subplots(figsize=(12, 8))
+        sns.barplot(x=perf.index, y=perf.values, palette=sentiment_palette, ax=ax)
         
         # Professional Typography
-        plt.title('Average Trader PnL per Sentiment Zone', fontsize=18, fontweight='bold', pad=20)
-        plt.ylabel('Average PnL (USD)', fontsize=14, fontweight='bold', labelpad=10)
+        ax.set_title('Average Trader PnL per Sentiment Zone', fontsize=18, fontweight='bold', pad=20)
+        ax.set_ylabel('Average PnL (USD)', fontsize=14, fontweight='bold', labelpad=10)
         
         # Adding Padding to X-Axis Label to prevent merging
-        plt.xlabel('Market Sentiment', fontsize=14, fontweight='bold', labelpad=20)
+        ax.set_xlabel('Market Sentiment', fontsize=14, fontweight='bold', labelpad=20)
         
         # Adding Padding to Tick Labels (The words "Extreme Fear", etc.)
         ax.tick_params(axis='x', pad=10)
         
         # Strong zero line
-        plt.axhline(0, color='black', linewidth=1.5, linestyle='--')
+        ax.axhline(0, color='black', linewidth=1.5, linestyle='--')
         
         # Clean look
-        sns.despine(left=True)
-        add_bar_labels(ax, fmt='${:.2f}')
+        sns.despine(ax=ax, left=True)
+        # Bold data labels (bar_label puts negative bars' labels below the bar)
+        for c in ax.containers:
+            ax.bar_label(c, fmt='${:.2f}', padding=8, fontsize=11, color='black', fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig('images/pnl_by_sentiment.png', dpi=300)
-        print("-> Saved professional images/pnl_by_sentiment.png")
+        save_figure(fig, 'images/pnl_by_sentiment.png')
     
     # --- Plot 2: Leverage ---
     if 'lev_clean' in merged_df.columns and merged_df['lev_clean'].notna().any():
-        plt.figure(figsize=(12, 8))
-        sns.scatterplot(x=merged_df['sentiment_value'], y=merged_df['lev_clean'], alpha=0.5, s=100,
-                        hue=merged_df['sentiment_value'], palette='viridis', edgecolor='w')
+        sample = merged_df.sample(min(SCATTER_SAMPLE_SIZE, len(merged_df)), random_state=0)
+
+        fig, ax = plt.subplots(figsize=(12, 8))
+        sns.scatterplot(x=sample['sentiment_value'], y=sample['lev_clean'], alpha=0.5, s=100,
+                        hue=sample['sentiment_value'], palette='viridis', edgecolor='w',
+                        legend=False, ax=ax)
         
-        plt.title('Leverage Usage vs. Fear & Greed Index', fontsize=18, fontweight='bold', pad=20)
-        plt.xlabel('Fear & Greed Index', fontsize=14, fontweight='bold', labelpad=15)
-        plt.ylabel('Leverage (x)', fontsize=14, fontweight='bold', labelpad=10)
+        ax.set_title('Leverage Usage vs. Fear & Greed Index', fontsize=18, fontweight='bold', pad=20)
+        ax.set_xlabel('Fear & Greed Index', fontsize=14, fontweight='bold', labelpad=15)
+        ax.set_ylabel('Leverage (x)', fontsize=14, fontweight='bold', labelpad=10)
         
-        sns.despine()
-        plt.legend([],[], frameon=False)
-        plt.tight_layout()
-        plt.savefig('images/leverage_vs_sentiment.png', dpi=300)
-        print("-> Saved professional images/leverage_vs_sentiment.png")
+        sns.despine(ax=ax)
+        save_figure(fig, 'images/leverage_vs_sentiment.png')
     else:
         print("-> Leverage column missing. Skipping leverage plot.")
 
     # --- Plot 3: Win Rate ---
-    if 'pnl_clean' in merged_df.columns and 'sentiment_bucket' in merged_df.columns:
-        merged_df['is_win'] = merged_df['pnl_clean'] > 0
-        win_rate = merged_df.groupby('sentiment_bucket')['is_win'].mean()
-        order = ['Extreme Fear', 'Fear', 'Greed', 'Extreme Greed']
-        win_rate = win_rate.reindex([x for x in order if x in win_rate.index])
+    if agg_df is not None:
+        win_rate = agg_df['win_rate']
 
-        plt.figure(figsize=(12, 8))
-        ax = sns.barplot(x=win_rate.index, y=win_rate.values, color='#008080') # Teal
+        fig, ax = plt.subplots(figsize=(12, 8))
+        sns.barplot(x=win_rate.index, y=win_rate.values, color='#008080', ax=ax) # Teal
         
-        plt.title('Win Rate by Market Sentiment', fontsize=18, fontweight='bold', pad=20)
-        plt.ylabel('Win Rate (%)', fontsize=14, fontweight='bold', labelpad=10)
-        plt.xlabel('Market Sentiment', fontsize=14, fontweight='bold', labelpad=20)
+        ax.set_title('Win Rate by Market Sentiment', fontsize=18, fontweight='bold', pad=20)
+        ax.set_ylabel('Win Rate (%)', fontsize=14, fontweight='bold', labelpad=10)
+        ax.set_xlabel('Market Sentiment', fontsize=14, fontweight='bold', labelpad=20)
         ax.tick_params(axis='x', pad=10)
         
-        plt.ylim(0, 1.1)
+        ax.set_ylim(0, 1.1)
         ax.yaxis.set_major_formatter(mtick.PercentFormatter(1.0))
         
-        sns.despine(left=True)
-        add_bar_labels(ax, fmt='{:.1%}')
+        sns.despine(ax=ax, left=True)
+        for c in ax.containers:
+            ax.bar_label(c, fmt='{:.1%}', padding=8, fontsize=11, color='black', fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig('images/win_rate_by_sentiment.png', dpi=300)
-        print("-> Saved professional images/win_rate_by_sentiment.png")
+        save_figure(fig, 'images/win_rate_by_sentiment.png')
 
     print("\nSUCCESS: Analysis Finished.")
 